@@ -7,13 +7,21 @@ This script runs the complete analysis pipeline:
 2. Extracts word counts for 'immigration' and 'productivity'
 3. Creates a visualization of trends over time
 
+By default, each newly downloaded PDF is counted on a process pool while the
+remaining downloads are still in flight, so step 2 mostly aggregates cached
+counts. Use --sequential to run the steps strictly one after another.
+
 Usage:
     python run_pipeline.py
     python run_pipeline.py --incremental
     python run_pipeline.py --incremental --skip-viz-if-no-changes
+    python run_pipeline.py --sequential
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -44,9 +52,50 @@ def parse_args():
         action="store_true",
         help="In incremental mode, skip visualization when no PDFs were processed.",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Finish all downloads before starting word-count extraction.",
+    )
     return parser.parse_args()
 
 
+def download_and_prime_cache():
+    """Download PDFs while counting each new one on a process pool.
+
+    Counts are stored in the word count cache, so the extraction step that
+    follows reuses them instead of parsing freshly downloaded PDFs again.
+    """
+    from download_documents import download_all_documents
+    from extract_word_counts import (
+        CACHE_FILE,
+        extract_worker_count,
+        open_count_cache,
+        store_submitted_counts,
+        submit_pdf_count,
+    )
+
+    # Workers start while download threads are running; spawn them rather
+    # than forking a multi-threaded process
+    mp_context = multiprocessing.get_context("spawn")
+    cache = open_count_cache(CACHE_FILE)
+    pending = []
+
+    with closing(cache), ProcessPoolExecutor(
+        max_workers=extract_worker_count(), mp_context=mp_context
+    ) as executor:
+
+        def on_download(pdf_path):
+            job = submit_pdf_count(executor, cache, pdf_path)
+            if job:
+                pending.append(job)
+
+        download_all_documents(on_download=on_download)
+        if pending:
+            print(f"\nWaiting for {len(pending)} overlapped extractions...")
+        store_submitted_counts(cache, pending)
+
+
 def main():
     args = parse_args()
 
@@ -63,13 +112,18 @@ def main():
         print("-" * 60)
         print("Skipped (--skip-download)")
         print()
-    else:
+    elif args.sequential:
         print("STEP 1: Downloading FOMC documents")
         print("-" * 60)
         from download_documents import download_all_documents
 
         download_all_documents()
         print()
+    else:
+        print("STEP 1: Downloading FOMC documents (overlapped with extraction)")
+        print("-" * 60)
+        download_and_prime_cache()
+        print()
 
     # Step 2: Extract word counts
     print("STEP 2: Extracting word counts")
@@ -10,57 +10,71 @@ Generates three output files:
 
 import csv
 from pathlib import Path
-from collections import defaultdict
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
+import numpy as np
+from PIL import Image
 
 # Paths (relative to project root, not src/)
 BASE_DIR = Path(__file__).parent.parent
 INPUT_FILE = BASE_DIR / "data" / "word_counts.csv"
 OUTPUT_DIR = BASE_DIR / "output"
 
+# Word/document-type series plotted by the charts
+SERIES_KEYS = [
+    'immigration_statement',
+    'immigration_transcript',
+    'immigration_minutes',
+    'productivity_statement',
+    'productivity_transcript',
+    'productivity_minutes',
+]
+
+# Space reserved below the axes for the footnote, in inches
+FOOTNOTE_HEIGHT_IN = 0.35
+
+# PNG output resolution and zlib level (1 encodes ~3x faster than the default 6)
+PNG_DPI = 150
+PNG_COMPRESS_LEVEL = 1
+
 
 def load_data():
     """Load and organize word count data from CSV."""
-    data = defaultdict(lambda: {
-        'immigration_statement': 0,
-        'immigration_transcript': 0,
-        'immigration_minutes': 0,
-        'productivity_statement': 0,
-        'productivity_transcript': 0,
-        'productivity_minutes': 0,
-    })
+    with open(INPUT_FILE, 'r') as f:
+        rows = list(csv.DictReader(f))
+
+    sorted_dates = sorted({row['meeting_date'] for row in rows})
+    date_index = {date: i for i, date in enumerate(sorted_dates)}
+    series_index = {key: i for i, key in enumerate(SERIES_KEYS)}
+
+    # One row per series, one column per meeting date
+    counts = np.zeros((len(SERIES_KEYS), len(sorted_dates)), dtype=np.int32)
     minutes_dates = set()
+    for row in rows:
+        date = row['meeting_date']
+        key = f"{row['word']}_{row['document_type']}"
+        if key in series_index:
+            counts[series_index[key], date_index[date]] = int(row['count'])
+        if row['document_type'] == 'minutes':
+            minutes_dates.add(date)
 
-    with open(INPUT_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            date = row['meeting_date']
-            key = f"{row['word']}_{row['document_type']}"
-            data[date][key] = int(row['count'])
-            if row['document_type'] == 'minutes':
-                minutes_dates.add(date)
-
-    sorted_dates = sorted(data.keys())
     latest_date = sorted_dates[-1] if sorted_dates else None
 
-    return {
+    data = {
         'dates': sorted_dates,
-        'immigration_statement': [data[d]['immigration_statement'] for d in sorted_dates],
-        'immigration_transcript': [data[d]['immigration_transcript'] for d in sorted_dates],
-        'immigration_minutes': [data[d]['immigration_minutes'] for d in sorted_dates],
-        'productivity_statement': [data[d]['productivity_statement'] for d in sorted_dates],
-        'productivity_transcript': [data[d]['productivity_transcript'] for d in sorted_dates],
-        'productivity_minutes': [data[d]['productivity_minutes'] for d in sorted_dates],
-        'latest_date': latest_date,
-        'latest_missing_minutes': bool(latest_date and latest_date not in minutes_dates),
+        'x': np.arange(len(sorted_dates)),
+        'date_labels': [d[:7] for d in sorted_dates],
     }
+    data.update({key: counts[i] for i, key in enumerate(SERIES_KEYS)})
+    data['latest_date'] = latest_date
+    data['latest_missing_minutes'] = bool(latest_date and latest_date not in minutes_dates)
+    return data
 
 
 def draw_bar_chart(ax, data):
     """Draw grouped stacked bar chart on given axes."""
-    sorted_dates = data['dates']
     immigration_statement = data['immigration_statement']
     immigration_transcript = data['immigration_transcript']
     immigration_minutes = data['immigration_minutes']
@@ -79,37 +93,34 @@ def draw_bar_chart(ax, data):
     }
 
     # Bar positions
-    x = list(range(len(sorted_dates)))
+    x = data['x']
     width = 0.35
 
     # Immigration bars (left)
-    x_imm = [i - width/2 for i in x]
+    x_imm = x - width/2
     ax.bar(x_imm, immigration_transcript, width, label='Immigration Transcript',
-           color=colors['immigration_transcript'])
+           color=colors['immigration_transcript'], rasterized=True)
     ax.bar(x_imm, immigration_minutes, width, bottom=immigration_transcript,
-           label='Immigration Minutes', color=colors['immigration_minutes'])
-    immigration_bottom = [
-        t + m for t, m in zip(immigration_transcript, immigration_minutes)
-    ]
+           label='Immigration Minutes', color=colors['immigration_minutes'], rasterized=True)
+    immigration_bottom = immigration_transcript + immigration_minutes
     ax.bar(x_imm, immigration_statement, width, bottom=immigration_bottom,
-           label='Immigration Statement', color=colors['immigration_statement'])
+           label='Immigration Statement', color=colors['immigration_statement'],
+           rasterized=True)
 
     # Productivity bars (right)
-    x_prod = [i + width/2 for i in x]
+    x_prod = x + width/2
     ax.bar(x_prod, productivity_transcript, width, label='Productivity Transcript',
-           color=colors['productivity_transcript'])
+           color=colors['productivity_transcript'], rasterized=True)
     ax.bar(x_prod, productivity_minutes, width, bottom=productivity_transcript,
-           label='Productivity Minutes', color=colors['productivity_minutes'])
-    productivity_bottom = [
-        t + m for t, m in zip(productivity_transcript, productivity_minutes)
-    ]
+           label='Productivity Minutes', color=colors['productivity_minutes'], rasterized=True)
+    productivity_bottom = productivity_transcript + productivity_minutes
     ax.bar(x_prod, productivity_statement, width, bottom=productivity_bottom,
-           label='Productivity Statement', color=colors['productivity_statement'])
+           label='Productivity Statement', color=colors['productivity_statement'],
+           rasterized=True)
 
     # Format
-    date_labels = [d[:7] for d in sorted_dates]
     ax.set_xticks(x)
-    ax.set_xticklabels(date_labels, rotation=45, ha='right', fontsize=7)
+    ax.set_xticklabels(data['date_labels'], rotation=45, ha='right', fontsize=7)
     ax.set_xlabel('FOMC Meeting Date', fontsize=10)
     ax.set_ylabel('Word Count', fontsize=10)
     ax.set_title('FOMC Documents: Immigration and Productivity Mentions (Stacked Bars)',
@@ -121,38 +132,29 @@ def draw_bar_chart(ax, data):
 
 def draw_line_chart(ax, data):
     """Draw line chart showing totals on given axes."""
-    sorted_dates = data['dates']
-
     # Calculate totals
-    immigration_total = [
-        s + t + m
-        for s, t, m in zip(
-            data['immigration_statement'],
-            data['immigration_transcript'],
-            data['immigration_minutes'],
-        )
-    ]
-    productivity_total = [
-        s + t + m
-        for s, t, m in zip(
-            data['productivity_statement'],
-            data['productivity_transcript'],
-            data['productivity_minutes'],
-        )
-    ]
-
-    x = list(range(len(sorted_dates)))
+    immigration_total = (
+        data['immigration_statement']
+        + data['immigration_transcript']
+        + data['immigration_minutes']
+    )
+    productivity_total = (
+        data['productivity_statement']
+        + data['productivity_transcript']
+        + data['productivity_minutes']
+    )
+
+    x = data['x']
 
     # Plot lines
     ax.plot(x, immigration_total, color='#1f77b4', linewidth=2, marker='o', markersize=4,
-            label='Immigration Total')
+            label='Immigration Total', rasterized=True)
     ax.plot(x, productivity_total, color='#ff7f0e', linewidth=2, marker='s', markersize=4,
-            label='Productivity Total')
+            label='Productivity Total', rasterized=True)
 
     # Format
-    date_labels = [d[:7] for d in sorted_dates]
     ax.set_xticks(x)
-    ax.set_xticklabels(date_labels, rotation=45, ha='right', fontsize=7)
+    ax.set_xticklabels(data['date_labels'], rotation=45, ha='right', fontsize=7)
     ax.set_xlabel('FOMC Meeting Date', fontsize=10)
     ax.set_ylabel('Total Mentions', fontsize=10)
     ax.set_title('FOMC Documents: Immigration and Productivity Mention Trends',
@@ -180,10 +182,58 @@ def build_footnote(data):
     return None
 
 
+def layout_figure(fig, footnote):
+    """Lay out a figure in one pass, reserving a strip at the bottom for the footnote."""
+    bottom = FOOTNOTE_HEIGHT_IN / fig.get_figheight() if footnote else 0
+    fig.tight_layout(rect=(0, bottom, 1, 1))
+
+
 def add_footnote(fig, footnote):
-    """Add a footnote to the bottom of a figure if needed."""
+    """Add a footnote to the bottom of a figure if needed and return its text artist."""
     if footnote:
-        fig.text(0.5, -0.02, footnote, ha='center', fontsize=9, fontstyle='italic', color='#555555')
+        return fig.text(0.5, 0.1 / fig.get_figheight(), footnote, ha='center', va='bottom',
+                        fontsize=9, fontstyle='italic', color='#555555')
+    return None
+
+
+def move_footnote_below(fig, note, ax):
+    """Reposition the footnote directly below an axes and its tick labels."""
+    renderer = fig.canvas.get_renderer()
+    ax_bottom = ax.get_tightbbox(renderer).y0 / fig.bbox.height
+    note.set_y(ax_bottom - 0.1 / fig.get_figheight())
+    note.set_verticalalignment('top')
+
+
+def artist_pixel_box(fig, artists, pad_inches=0.1):
+    """Return the padded union of the artists' tight bounding boxes as a Pillow crop box."""
+    renderer = fig.canvas.get_renderer()
+    bbox = Bbox.union([
+        artist.get_tightbbox(renderer) for artist in artists if artist is not None
+    ]).padded(pad_inches * fig.dpi)
+    width, height = fig.canvas.get_width_height()
+    # Display coordinates grow upwards from the bottom; image rows grow downwards
+    return (
+        max(0, int(bbox.x0)),
+        max(0, int(height - bbox.y1)),
+        min(width, int(np.ceil(bbox.x1))),
+        min(height, int(np.ceil(height - bbox.y0))),
+    )
+
+
+def render_png(fig):
+    """Draw the figure once and wrap the Agg RGBA buffer as a Pillow image.
+
+    The image shares memory with the canvas, so save it before drawing again.
+    """
+    fig.canvas.draw()
+    return Image.frombuffer(
+        'RGBA', fig.canvas.get_width_height(), fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1
+    )
+
+
+def save_png(image, path):
+    """Write a PNG with fast zlib compression instead of savefig's default level."""
+    image.save(path, format='PNG', compress_level=PNG_COMPRESS_LEVEL, dpi=(PNG_DPI, PNG_DPI))
 
 
 def create_visualization():
@@ -201,48 +251,45 @@ def create_visualization():
     footnote = build_footnote(data)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # 1. Combined chart (bar + line)
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(18, 12))
+    # Draw both charts once; the single-chart outputs are cropped from this figure
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(18, 12), dpi=PNG_DPI)
     draw_bar_chart(ax1, data)
     draw_line_chart(ax2, data)
-    plt.tight_layout()
-    add_footnote(fig, footnote)
+    layout_figure(fig, footnote)
+    note = add_footnote(fig, footnote)
+    image = render_png(fig)
+
+    # 1. Combined chart (bar + line)
     combined_path = OUTPUT_DIR / "fomc_word_trends.png"
-    plt.savefig(combined_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    save_png(image, combined_path)
     print(f"Saved: {combined_path}")
 
-    # 2. Bar chart only
-    fig, ax = plt.subplots(figsize=(18, 8))
-    draw_bar_chart(ax, data)
-    plt.tight_layout()
-    add_footnote(fig, footnote)
-    bars_path = OUTPUT_DIR / "fomc_word_trends_bars.png"
-    plt.savefig(bars_path, dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved: {bars_path}")
-
-    # 3. Line chart only
-    fig, ax = plt.subplots(figsize=(18, 6))
-    draw_line_chart(ax, data)
-    plt.tight_layout()
-    add_footnote(fig, footnote)
+    # 2. Line chart only (bottom panel, already directly above the footnote)
     lines_path = OUTPUT_DIR / "fomc_word_trends_lines.png"
-    plt.savefig(lines_path, dpi=150, bbox_inches='tight')
-    plt.close()
+    save_png(image.crop(artist_pixel_box(fig, [ax2, note])), lines_path)
     print(f"Saved: {lines_path}")
 
+    # 3. Bar chart only (hide the line panel and move the footnote under the bars)
+    ax2.set_visible(False)
+    if note:
+        move_footnote_below(fig, note, ax1)
+    image = render_png(fig)
+    bars_path = OUTPUT_DIR / "fomc_word_trends_bars.png"
+    save_png(image.crop(artist_pixel_box(fig, [ax1, note])), bars_path)
+    plt.close(fig)
+    print(f"Saved: {bars_path}")
+
     # Summary
     print("\n" + "=" * 50)
     print("Data summary:")
     print(f"  Meeting dates: {len(data['dates'])}")
     print(f"  Date range: {data['dates'][0]} to {data['dates'][-1]}")
-    print(f"  Immigration Statement: {sum(data['immigration_statement'])}")
-    print(f"  Immigration Transcript: {sum(data['immigration_transcript'])}")
-    print(f"  Immigration Minutes: {sum(data['immigration_minutes'])}")
-    print(f"  Productivity Statement: {sum(data['productivity_statement'])}")
-    print(f"  Productivity Transcript: {sum(data['productivity_transcript'])}")
-    print(f"  Productivity Minutes: {sum(data['productivity_minutes'])}")
+    print(f"  Immigration Statement: {data['immigration_statement'].sum()}")
+    print(f"  Immigration Transcript: {data['immigration_transcript'].sum()}")
+    print(f"  Immigration Minutes: {data['immigration_minutes'].sum()}")
+    print(f"  Productivity Statement: {data['productivity_statement'].sum()}")
+    print(f"  Productivity Transcript: {data['productivity_transcript'].sum()}")
+    print(f"  Productivity Minutes: {data['productivity_minutes'].sum()}")
 
 
 if __name__ == "__main__":
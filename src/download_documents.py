@@ -6,9 +6,13 @@ Downloads documents from the Federal Reserve website for all FOMC meetings
 from 2012-2026.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
 import re
+import shutil
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 
 # FOMC calendar page for dynamic date fetching
 CALENDAR_URL = "https://www.federalreserve.gov/monetarypolicy/fomccalendars.htm"
@@ -73,13 +77,13 @@ TRANSCRIPTS_DIR = BASE_DIR / "data" / "transcripts"
 MINUTES_DIR = BASE_DIR / "data" / "minutes"
 
 
-def fetch_meeting_dates():
+def fetch_meeting_dates(session):
     """Fetch FOMC meeting dates, combining fallback dates with scraped dates."""
     # Start with fallback dates (ensures historical coverage)
     all_dates = set(FALLBACK_MEETING_DATES)
 
     try:
-        response = requests.get(CALENDAR_URL, timeout=30)
+        response = session.get(CALENDAR_URL, timeout=30)
         response.raise_for_status()
 
         # Extract dates from document links
@@ -109,98 +113,102 @@ def fetch_meeting_dates():
     return sorted(all_dates)
 
 
-def download_file(url, output_path):
+def create_session():
+    """Create an HTTP session with a connection pool sized for parallel downloads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_file(session, url, output_path):
     """Download a file from URL to output path. Returns True if successful."""
+    tmp_path = output_path.with_suffix(output_path.suffix + ".part")
     try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
-            return True
-        else:
-            return False
-    except requests.RequestException as e:
+        with session.get(url, timeout=30, stream=True) as response:
+            if response.status_code != 200:
+                return False
+            response.raw.decode_content = True
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f)
+        os.replace(tmp_path, output_path)
+        return True
+    except (requests.RequestException, OSError) as e:
         print(f"  Error downloading {url}: {e}")
+        tmp_path.unlink(missing_ok=True)
         return False
 
 
-def download_all_documents():
-    """Download all FOMC statements, transcripts, and minutes."""
+def download_all_documents(on_download=None):
+    """Download all FOMC statements, transcripts, and minutes.
+
+    Args:
+        on_download: Optional callback invoked with the path of each newly
+            downloaded PDF as soon as it is on disk.
+    """
     # Create directories
     STATEMENTS_DIR.mkdir(parents=True, exist_ok=True)
     TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
     MINUTES_DIR.mkdir(parents=True, exist_ok=True)
-    meeting_dates = fetch_meeting_dates()
 
-    statement_count = 0
-    transcript_count = 0
-    minutes_count = 0
-    failed_statements = []
-    failed_transcripts = []
-    failed_minutes = []
+    # One pooled session serves the calendar page and every PDF download
+    session = create_session()
+    meeting_dates = fetch_meeting_dates(session)
+
+    new_counts = {"statement": 0, "transcript": 0, "minutes": 0}
+    failed = {"statement": [], "transcript": [], "minutes": []}
 
     print("Downloading FOMC documents...")
     print("=" * 50)
 
+    # Build the list of pending downloads, skipping files already on disk
+    jobs = []
     for date in meeting_dates:
-        # Download statement
-        statement_url = STATEMENT_URL.format(date=date)
-        statement_path = STATEMENTS_DIR / f"monetary{date}a1.pdf"
-
-        if statement_path.exists():
-            print(f"[{date}] Statement already exists, skipping")
-        else:
-            print(f"[{date}] Downloading statement...", end=" ")
-            if download_file(statement_url, statement_path):
-                print("OK")
-                statement_count += 1
-            else:
-                print("FAILED")
-                failed_statements.append(date)
-
-        # Download transcript
-        transcript_url = TRANSCRIPT_URL.format(date=date)
-        transcript_path = TRANSCRIPTS_DIR / f"FOMCpresconf{date}.pdf"
-
-        if transcript_path.exists():
-            print(f"[{date}] Transcript already exists, skipping")
-        else:
-            print(f"[{date}] Downloading transcript...", end=" ")
-            if download_file(transcript_url, transcript_path):
-                print("OK")
-                transcript_count += 1
+        for doc_type, label, url, path in (
+            ("statement", "Statement",
+             STATEMENT_URL.format(date=date), STATEMENTS_DIR / f"monetary{date}a1.pdf"),
+            ("transcript", "Transcript",
+             TRANSCRIPT_URL.format(date=date), TRANSCRIPTS_DIR / f"FOMCpresconf{date}.pdf"),
+            ("minutes", "Minutes",
+             MINUTES_URL.format(date=date), MINUTES_DIR / f"fomcminutes{date}.pdf"),
+        ):
+            if path.exists():
+                print(f"[{date}] {label} already exists, skipping")
             else:
-                print("FAILED")
-                failed_transcripts.append(date)
-
-        # Download minutes
-        minutes_url = MINUTES_URL.format(date=date)
-        minutes_path = MINUTES_DIR / f"fomcminutes{date}.pdf"
-
-        if minutes_path.exists():
-            print(f"[{date}] Minutes already exists, skipping")
-        else:
-            print(f"[{date}] Downloading minutes...", end=" ")
-            if download_file(minutes_url, minutes_path):
-                print("OK")
-                minutes_count += 1
+                jobs.append((date, doc_type, label, url, path))
+
+    # Downloads are network-bound, so overlap them across a thread pool
+    max_workers = int(os.environ.get("FOMC_DOWNLOAD_THREADS", 8))
+    with session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(download_file, session, url, path): (date, doc_type, label, path)
+            for date, doc_type, label, url, path in jobs
+        }
+        for future in as_completed(futures):
+            date, doc_type, label, path = futures[future]
+            if future.result():
+                print(f"[{date}] Downloading {label.lower()}... OK")
+                new_counts[doc_type] += 1
+                if on_download:
+                    on_download(path)
             else:
-                print("FAILED")
-                failed_minutes.append(date)
+                print(f"[{date}] Downloading {label.lower()}... FAILED")
+                failed[doc_type].append(date)
 
     # Summary
     print("\n" + "=" * 50)
     print("Download Summary:")
-    print(f"  Statements: {statement_count} new downloads")
-    print(f"  Transcripts: {transcript_count} new downloads")
-    print(f"  Minutes: {minutes_count} new downloads")
-
-    if failed_statements:
-        print(f"\n  Failed statements: {failed_statements}")
-    if failed_transcripts:
-        print(f"\n  Failed transcripts: {failed_transcripts}")
-    if failed_minutes:
-        print(f"  Failed minutes: {failed_minutes}")
+    print(f"  Statements: {new_counts['statement']} new downloads")
+    print(f"  Transcripts: {new_counts['transcript']} new downloads")
+    print(f"  Minutes: {new_counts['minutes']} new downloads")
+
+    if failed["statement"]:
+        print(f"\n  Failed statements: {sorted(failed['statement'])}")
+    if failed["transcript"]:
+        print(f"\n  Failed transcripts: {sorted(failed['transcript'])}")
+    if failed["minutes"]:
+        print(f"  Failed minutes: {sorted(failed['minutes'])}")
         print("  Note: March 3, 2020 was an emergency meeting with no published minutes.")
 
     total_statements = len(list(STATEMENTS_DIR.glob("*.pdf")))
@@ -8,19 +8,44 @@ counting occurrences of specified words and outputting to CSV.
 
 import argparse
 import csv
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+import hashlib
+import json
+import os
 import re
+import sqlite3
 from pathlib import Path
 import pdfplumber
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 # Words to count (case-insensitive)
 WORDS_TO_COUNT = ["immigration", "productivity"]
 
-# Precompile regex patterns for better performance
-WORD_PATTERNS = {
-    word: re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
-    for word in WORDS_TO_COUNT
-}
+# Single alternation pattern so the text is scanned once for all words
+# (longest words first so a shorter word never shadows a longer one)
+WORD_PATTERN = re.compile(
+    r"\b("
+    + "|".join(map(re.escape, sorted(WORDS_TO_COUNT, key=len, reverse=True)))
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# PDFium's C++ text extraction is much faster than pdfplumber's layout model;
+# set FOMC_USE_PDFIUM=0 to fall back to pdfplumber.
+USE_PDFIUM = pdfium is not None and os.environ.get("FOMC_USE_PDFIUM", "1") != "0"
+
+FILENAME_DATE_PATTERN = re.compile(r"(\d{8})")
+
+# Files smaller than this or without the PDF header are error pages or empty
+# downloads, so they are skipped without starting a PDF parser
+MIN_PDF_BYTES = 2048
+PDF_MAGIC = b"%PDF-"
 
 # Directories (relative to project root, not src/)
 BASE_DIR = Path(__file__).parent.parent
@@ -28,15 +53,24 @@ STATEMENTS_DIR = BASE_DIR / "data" / "statements"
 TRANSCRIPTS_DIR = BASE_DIR / "data" / "transcripts"
 MINUTES_DIR = BASE_DIR / "data" / "minutes"
 OUTPUT_FILE = BASE_DIR / "data" / "word_counts.csv"
+CACHE_FILE = BASE_DIR / "data" / ".wordcount_cache.sqlite"
+OUTPUT_FIELDS = ["meeting_date", "document_type", "word", "count"]
+
+# Large write buffer so CSV rows are flushed in a few big syscalls
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def extract_date_from_filename(filename):
     """Extract date from filename like FOMCpresconf20200129.pdf -> 2020-01-29"""
-    match = re.search(r"(\d{8})", filename)
-    if match:
+    # Transcripts and minutes end in YYYYMMDD.pdf, so slice before falling back
+    # to a search for names like monetary20200129a1.pdf
+    date_str = filename[-12:-4]
+    if not (len(date_str) == 8 and date_str.isdigit()):
+        match = FILENAME_DATE_PATTERN.search(filename)
+        if not match:
+            return None
         date_str = match.group(1)
-        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-    return None
+    return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
 
 def load_existing_index(csv_path):
@@ -67,26 +101,137 @@ def load_existing_index(csv_path):
     return index
 
 
-def count_words_in_pdf(pdf_path, words):
-    """Extract text from PDF and count occurrences of each target word."""
-    counts = {word: 0 for word in words}
-    patterns = {word: WORD_PATTERNS[word] for word in words}
+def file_sha256(path):
+    """Return the hex SHA-256 digest of a file's contents."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def open_count_cache(cache_path):
+    """Open the per-PDF word count cache, creating it if needed."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS word_counts ("
+        "hash TEXT, words TEXT, backend TEXT, counts_json TEXT, "
+        "PRIMARY KEY (hash, words, backend))"
+    )
+    return conn
 
-    try:
+
+def cache_key(digest):
+    """Return the cache key for a PDF digest, word list, and text backend."""
+    backend = "pdfium" if USE_PDFIUM else "pdfplumber"
+    return (digest, ",".join(sorted(WORDS_TO_COUNT)), backend)
+
+
+def load_cached_counts(conn, digest):
+    """Return cached counts for a PDF digest, or None on a cache miss."""
+    row = conn.execute(
+        "SELECT counts_json FROM word_counts WHERE hash = ? AND words = ? AND backend = ?",
+        cache_key(digest),
+    ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def store_cached_counts(conn, digest, counts):
+    """Store counts for a PDF digest in the cache."""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO word_counts (hash, words, backend, counts_json) "
+            "VALUES (?, ?, ?, ?)",
+            (*cache_key(digest), json.dumps(counts)),
+        )
+
+
+def extract_worker_count():
+    """Return the number of extraction worker processes."""
+    return int(os.environ.get("FOMC_EXTRACT_WORKERS", os.cpu_count() or 1))
+
+
+def submit_pdf_count(executor, cache, pdf_path):
+    """Start counting a PDF on the executor unless its counts are already cached.
+
+    Returns a (digest, future) pair, or None on a cache hit.
+    """
+    digest = file_sha256(pdf_path)
+    if load_cached_counts(cache, digest) is not None:
+        return None
+    return digest, executor.submit(count_words_in_pdf, pdf_path, WORDS_TO_COUNT)
+
+
+def store_submitted_counts(cache, pending):
+    """Wait for submitted PDF counts and store the successful ones in the cache."""
+    for digest, future in pending:
+        counts = future.result()
+        if counts is not None:
+            store_cached_counts(cache, digest, counts)
+
+
+def looks_like_pdf(pdf_path):
+    """Return whether a file is large enough and starts with the PDF header."""
+    if Path(pdf_path).stat().st_size < MIN_PDF_BYTES:
+        return False
+    with open(pdf_path, "rb") as f:
+        return f.read(len(PDF_MAGIC)) == PDF_MAGIC
+
+
+def iter_page_texts(pdf_path):
+    """Yield the text of each PDF page using the configured backend."""
+    if USE_PDFIUM:
+        # Open by path so PDFium reads only the byte ranges it needs from disk;
+        # passing bytes would load the whole file into memory first
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            for i in range(len(pdf)):
+                page = pdf[i]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+    else:
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
-                text = page.extract_text() or ""
-                for word, pattern in patterns.items():
-                    counts[word] += len(pattern.findall(text))
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    # Drop cached chars/objects so memory stays flat on long PDFs
+                    page.flush_cache()
+                    if hasattr(page.get_textmap, "cache_clear"):
+                        page.get_textmap.cache_clear()
+
+
+def count_words_in_pdf(pdf_path, words):
+    """Extract text from PDF and count occurrences of each target word.
+
+    Returns None if the PDF could not be read.
+    """
+    try:
+        if not looks_like_pdf(pdf_path):
+            print(f"  Skipped {pdf_path}: not a PDF (likely a saved error page)")
+            return {word: 0 for word in words}
+        text = "\n".join(iter_page_texts(pdf_path))
     except Exception as e:
         print(f"  Error processing {pdf_path}: {e}")
+        return None
 
-    return counts
+    # One scan over the whole document instead of one per page
+    matches = Counter(m.group(1).lower() for m in WORD_PATTERN.finditer(text))
+    return {word: matches[word] for word in words}
 
 
-def process_directory(directory, doc_type, index, expected_keys, incremental):
+def process_directory(directory, doc_type, index, expected_keys, incremental, executor, cache):
     """Process PDFs in a directory and update index with new counts."""
-    processed_pdfs = 0
+    jobs = []
     pdf_files = sorted(directory.glob("*.pdf"))
 
     for pdf_path in pdf_files:
@@ -107,18 +252,49 @@ def process_directory(directory, doc_type, index, expected_keys, incremental):
             continue
 
         words_to_count = missing_words if incremental else WORDS_TO_COUNT
-        counts = count_words_in_pdf(pdf_path, words_to_count)
+        jobs.append((pdf_path, meeting_date, words_to_count))
+
+    # Cache lookups stay in this process so only cache misses reach the workers
+    digests = [file_sha256(pdf_path) for pdf_path, _, _ in jobs]
+    cached = [load_cached_counts(cache, digest) for digest in digests]
+    misses = [
+        (pdf_path, digest)
+        for (pdf_path, _, _), digest, counts in zip(jobs, digests, cached)
+        if counts is None
+    ]
+
+    # PDF parsing is CPU-bound, so fan the misses out across worker processes
+    parsed = {}
+    all_counts = executor.map(
+        count_words_in_pdf,
+        [pdf_path for pdf_path, _ in misses],
+        [WORDS_TO_COUNT] * len(misses),
+        chunksize=2,
+    )
+    for (pdf_path, digest), counts in zip(misses, all_counts):
+        if counts is None:
+            counts = {word: 0 for word in WORDS_TO_COUNT}
+        else:
+            store_cached_counts(cache, digest, counts)
+        parsed[pdf_path] = counts
 
-        for word, count in counts.items():
-            index[(meeting_date, doc_type, word)] = count
+    for (pdf_path, meeting_date, words_to_count), counts in zip(jobs, cached):
+        from_cache = counts is not None
+        if not from_cache:
+            counts = parsed[pdf_path]
 
-        processed_pdfs += 1
+        for word in words_to_count:
+            index[(meeting_date, doc_type, word)] = counts.get(word, 0)
+
+        details = []
         if incremental:
-            print(f"  Processed: {pdf_path.name} ({len(words_to_count)} missing words)")
-        else:
-            print(f"  Processed: {pdf_path.name}")
+            details.append(f"{len(words_to_count)} missing words")
+        if from_cache:
+            details.append("cached")
+        suffix = f" ({', '.join(details)})" if details else ""
+        print(f"  Processed: {pdf_path.name}{suffix}")
 
-    return processed_pdfs
+    return len(jobs)
 
 
 def build_results(index, expected_keys):
@@ -165,49 +341,56 @@ def extract_all_word_counts(incremental: bool = False) -> int:
     expected_keys = set()
     processed_pdfs = 0
 
-    print("\nProcessing statements...")
-    if STATEMENTS_DIR.exists():
+    cache = open_count_cache(CACHE_FILE)
+    with closing(cache), ProcessPoolExecutor(max_workers=extract_worker_count()) as executor:
+        print("\nProcessing statements...")
+        if STATEMENTS_DIR.exists():
+            processed_pdfs += process_directory(
+                STATEMENTS_DIR,
+                "statement",
+                index,
+                expected_keys,
+                incremental,
+                executor,
+                cache,
+            )
+        else:
+            print(f"  Skipped: {STATEMENTS_DIR} does not exist")
+
+        print("\nProcessing transcripts...")
         processed_pdfs += process_directory(
-            STATEMENTS_DIR,
-            "statement",
+            TRANSCRIPTS_DIR,
+            "transcript",
             index,
             expected_keys,
             incremental,
+            executor,
+            cache,
         )
-    else:
-        print(f"  Skipped: {STATEMENTS_DIR} does not exist")
-
-    print("\nProcessing transcripts...")
-    processed_pdfs += process_directory(
-        TRANSCRIPTS_DIR,
-        "transcript",
-        index,
-        expected_keys,
-        incremental,
-    )
 
-    print("\nProcessing minutes...")
-    processed_pdfs += process_directory(
-        MINUTES_DIR,
-        "minutes",
-        index,
-        expected_keys,
-        incremental,
-    )
+        print("\nProcessing minutes...")
+        processed_pdfs += process_directory(
+            MINUTES_DIR,
+            "minutes",
+            index,
+            expected_keys,
+            incremental,
+            executor,
+            cache,
+        )
 
     # Build sorted, deduped output rows
     all_results = build_results(index, expected_keys)
 
     # Write to CSV
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["meeting_date", "document_type", "word", "count"],
-            lineterminator="\n",
+    with open(OUTPUT_FILE, "w", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(OUTPUT_FIELDS)
+        writer.writerows(
+            (row["meeting_date"], row["document_type"], row["word"], row["count"])
+            for row in all_results
         )
-        writer.writeheader()
-        writer.writerows(all_results)
 
     print("\n" + "=" * 50)
     print(f"Results saved to: {OUTPUT_FILE}")
@@ -20,6 +20,7 @@ import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter, YearLocator
 import pdfplumber
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MINUTES_DIR = BASE_DIR / "data" / "minutes"
@@ -179,10 +180,9 @@ def fetch_statement_length(session, meeting_date):
     raise last_error or ValueError(f"No statement found for {meeting_date}")
 
 
-def fetch_statement_row(meeting_date):
+def fetch_statement_row(session, meeting_date):
     """Fetch one statement length row."""
-    with requests.Session() as session:
-        length_words, source, statement_date = fetch_statement_length(session, meeting_date)
+    length_words, source, statement_date = fetch_statement_length(session, meeting_date)
     return {
         "meeting_date": statement_date,
         "document_type": "statement",
@@ -210,9 +210,11 @@ def build_length_rows():
 
     statement_dates = load_dates_from_pdf_dirs()
     print(f"  Fetching {len(statement_dates)} statements...", flush=True)
-    with ThreadPoolExecutor(max_workers=8) as executor:
+    # Share one pooled session so worker threads reuse connections to the host
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=8) as executor:
+        session.mount("https://", HTTPAdapter(pool_maxsize=8))
         futures = {
-            executor.submit(fetch_statement_row, meeting_date): meeting_date
+            executor.submit(fetch_statement_row, session, meeting_date): meeting_date
             for meeting_date in statement_dates
         }
         completed = 0
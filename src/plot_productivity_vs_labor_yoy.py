@@ -6,14 +6,17 @@ and plot it against quarterly total FOMC productivity mentions
 """
 
 import csv
+import json
 import os
-from datetime import date, datetime
+import time
+from datetime import date
 from pathlib import Path
 
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter, YearLocator
+import numpy as np
 import requests
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,6 +29,11 @@ DOTENV_FILE = BASE_DIR / ".env"
 FRED_SERIES_ID = "OPHNFB"
 FRED_SERIES_NAME = "Labor Productivity (Output Per Hour, Nonfarm Business)"
 FRED_URL = "https://api.stlouisfed.org/fred/series/observations"
+FRED_CACHE_DIR = BASE_DIR / "data" / ".fred_cache"
+FRED_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Large write buffer so CSV rows are flushed in a few big syscalls
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def load_dotenv_file(dotenv_path):
@@ -59,6 +67,11 @@ def quarter_from_date(dt):
     return (dt.year, (dt.month - 1) // 3 + 1)
 
 
+def quarter_from_iso_date(date_str):
+    """Return quarter tuple (year, quarter_number) for a YYYY-MM-DD string."""
+    return (int(date_str[:4]), (int(date_str[5:7]) - 1) // 3 + 1)
+
+
 def quarter_label(year, quarter):
     """Format quarter label like 2026-Q1."""
     return f"{year}-Q{quarter}"
@@ -90,15 +103,18 @@ def load_productivity_mentions_by_quarter(csv_path):
             if row.get("word") != "productivity":
                 continue
 
-            meeting_date = datetime.strptime(row["meeting_date"], "%Y-%m-%d").date()
-            quarter_key = quarter_from_date(meeting_date)
+            quarter_key = quarter_from_iso_date(row["meeting_date"])
             totals[quarter_key] = totals.get(quarter_key, 0) + int(row["count"])
 
     return totals
 
 
-def fetch_fred_series(api_key, series_id):
-    """Fetch FRED series observations."""
+def fetch_fred_payload(api_key, series_id):
+    """Fetch the FRED observations payload, reusing a cached copy for up to a day."""
+    cache_path = FRED_CACHE_DIR / f"{series_id}.json"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < FRED_CACHE_TTL_SECONDS:
+        return json.loads(cache_path.read_text())
+
     params = {
         "series_id": series_id,
         "api_key": api_key,
@@ -106,8 +122,20 @@ def fetch_fred_series(api_key, series_id):
     }
     response = requests.get(FRED_URL, params=params, timeout=30)
     response.raise_for_status()
-
     payload = response.json()
+
+    # Write atomically so an interrupted run never leaves a truncated cache file
+    FRED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(response.content)
+    os.replace(tmp_path, cache_path)
+
+    return payload
+
+
+def fetch_fred_series(api_key, series_id):
+    """Fetch FRED series observations."""
+    payload = fetch_fred_payload(api_key, series_id)
     observations = payload.get("observations", [])
 
     series = []
@@ -121,7 +149,7 @@ def fetch_fred_series(api_key, series_id):
         date_str = obs.get("date")
         if not date_str:
             continue
-        obs_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        obs_date = date.fromisoformat(date_str)
         series.append((obs_date, value))
 
     series.sort(key=lambda x: x[0])
@@ -130,19 +158,23 @@ def fetch_fred_series(api_key, series_id):
 
 def compute_yoy_percent_change(series):
     """Compute y/y percent change using a 4-observation lag (quarterly data)."""
-    yoy_series = []
-    for idx, (obs_date, value) in enumerate(series):
-        if idx < 4:
-            continue
-
-        prior_value = series[idx - 4][1]
-        if prior_value == 0:
-            continue
-
-        yoy = ((value / prior_value) - 1.0) * 100.0
-        yoy_series.append((obs_date, yoy))
-
-    return yoy_series
+    if len(series) <= 4:
+        return []
+
+    obs_dates = [obs_date for obs_date, _ in series]
+    values = np.array([value for _, value in series], dtype=float)
+    current, prior = values[4:], values[:-4]
+
+    # Skip observations whose year-ago value is zero rather than dividing by it
+    valid = prior != 0
+    ratio = np.divide(current, prior, out=np.full_like(current, np.nan), where=valid)
+    yoy = (ratio - 1.0) * 100.0
+
+    return [
+        (obs_date, float(value))
+        for obs_date, value, is_valid in zip(obs_dates[4:], yoy, valid)
+        if is_valid
+    ]
 
 
 def build_yoy_by_quarter(yoy_series):
@@ -173,7 +205,7 @@ def combine_quarterly_series(mentions_by_quarter, yoy_by_quarter):
 def write_combined_data(output_path, combined_data):
     """Write combined quarterly data to CSV."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", newline="") as f:
+    with open(output_path, "w", newline="", buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f, lineterminator="\n")
         writer.writerow([
             "quarter",